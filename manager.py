@@ -14,7 +14,9 @@ Features:
 API Version: 1.0.0
 """
 
+import bisect
 import logging
+from collections import namedtuple
 from datetime import date, datetime
 from typing import Dict, Any, Tuple, Optional
 from pathlib import Path
@@ -42,6 +44,60 @@ OLYMPICS_DATES = [
     (2032, 8, 8, "summer", "Brisbane"),
 ]
 
+# Olympic ring colors for the programmatic logo fallback
+RING_COLORS_TOP = (
+    (0, 129, 200),    # Blue
+    (0, 0, 0),        # Black
+    (255, 20, 24),    # Red
+)
+RING_COLORS_BOTTOM = (
+    (255, 195, 0),    # Yellow
+    (0, 158, 96),     # Green
+)
+
+# (color, x offset, y offset) of each ring center, in ring radii from the logo center
+RING_LAYOUT = tuple(
+    (color, -1 + i * 1.5, -1) for i, color in enumerate(RING_COLORS_TOP)
+) + tuple(
+    (color, i * 1.5, 1) for i, color in enumerate(RING_COLORS_BOTTOM)
+)
+
+# Probe string used to estimate average character width per font
+FONT_PROBE_TEXT = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Maximum number of cached text layouts (only a handful of distinct line sets occur)
+LAYOUT_CACHE_SIZE = 16
+
+
+# A single Olympics with its ceremony dates (and their ordinals), type and location
+OlympicsEvent = namedtuple(
+    'OlympicsEvent', 'opening closing opening_ord closing_ord type location'
+)
+
+
+def _build_olympics_event(opening: tuple, closing: tuple) -> OlympicsEvent:
+    """Build an OlympicsEvent from an opening/closing pair of OLYMPICS_DATES."""
+    opening_date = date(opening[0], opening[1], opening[2])
+    closing_date = date(closing[0], closing[1], closing[2])
+    return OlympicsEvent(
+        opening=opening_date,
+        closing=closing_date,
+        opening_ord=opening_date.toordinal(),
+        closing_ord=closing_date.toordinal(),
+        type=opening[3],
+        location=opening[4]
+    )
+
+
+# Olympics events built once from OLYMPICS_DATES (opening/closing pairs)
+_OLYMPICS_EVENTS = tuple(
+    _build_olympics_event(opening, closing)
+    for opening, closing in zip(OLYMPICS_DATES[::2], OLYMPICS_DATES[1::2])
+)
+
+# Closing ceremony ordinals, parallel to _OLYMPICS_EVENTS (sorted) for bisect lookups
+_CLOSING_ORDINALS = [event.closing_ord for event in _OLYMPICS_EVENTS]
+
 
 class OlympicsCountdownPlugin(BasePlugin):
     """
@@ -59,11 +115,12 @@ class OlympicsCountdownPlugin(BasePlugin):
         """Initialize the Olympics countdown plugin."""
         super().__init__(plugin_id, config, display_manager, cache_manager, plugin_manager)
         
-        # Parse colors - convert to integers in case they come from JSON as strings
+        # Parse colors - convert to integers in case they come from JSON as strings,
+        # clamped to 0-255 so display() always hands PIL a valid RGB tuple
         def _parse_color(name, default):
             raw = config.get(name, default)
             try:
-                return tuple(int(c) for c in raw)
+                return tuple(max(0, min(255, int(c))) for c in raw)
             except (ValueError, TypeError):
                 try:
                     return tuple(raw)
@@ -79,8 +136,17 @@ class OlympicsCountdownPlugin(BasePlugin):
         self.current_olympics = None
         self.countdown_type = "opening"  # "opening" or "closing"
         self.logo_image = None
+        self._logo_cache = {}  # (width, height) -> rendered logo image
+        self._layout_cache = {}  # (width, height, lines) -> text layout
         self.last_calculated_date = None
         self.last_displayed_message = None  # Track last displayed to prevent unnecessary redraws
+        self._cached_message = None  # Message/lines built in update(), read by display()
+        self._cached_lines = None
+        self._calc_cache_key = None  # Ordinal of the day the cached calculation belongs to
+        self._calc_cache_val = None
+        
+        # Font metrics are constant for the life of the plugin
+        self._avg_char_widths = self._measure_avg_char_widths()
         
         # Load logo image if available
         self._load_logo_image()
@@ -92,20 +158,24 @@ class OlympicsCountdownPlugin(BasePlugin):
         try:
             plugin_dir = Path(__file__).parent
             
-            # Try common image filenames
-            possible_names = [
-                "olympics-logo.png",
-                "olympics logo.png",
-                "olympics-icon.png",
-                "logo.png",
-                "assets/olympics-logo.png",
-                "assets/logo.png"
+            # Try common image filenames (in priority order), listing each directory
+            # once instead of stat-ing every candidate path
+            search_dirs = [
+                (plugin_dir, ["olympics-logo.png", "olympics logo.png", "olympics-icon.png", "logo.png"]),
+                (plugin_dir / "assets", ["olympics-logo.png", "logo.png"])
             ]
             
-            for name in possible_names:
-                logo_path = plugin_dir / name
-                if logo_path.exists():
-                    self.logo_image = Image.open(logo_path)
+            for directory, candidates in search_dirs:
+                if not directory.is_dir():
+                    continue
+                present = {p.name for p in directory.iterdir()}
+                name = next((n for n in candidates if n in present), None)
+                if name is not None:
+                    logo_path = directory / name
+                    with Image.open(logo_path) as img:
+                        img.load()
+                        # Normalize to RGBA once so resizing/pasting never converts per frame
+                        self.logo_image = img.convert('RGBA')
                     self.logger.info(f"Loaded Olympics logo image from {logo_path}")
                     return
             
@@ -115,47 +185,51 @@ class OlympicsCountdownPlugin(BasePlugin):
             self.logger.warning(f"Error loading logo image: {e}, will use programmatic drawing")
             self.logo_image = None
     
-    def _get_next_olympics(self) -> Tuple[Optional[Dict[str, Any]], bool]:
+    def _measure_avg_char_widths(self) -> Dict[str, float]:
+        """
+        Measure the average character width of each display font once.
+        
+        Returns:
+            Dict mapping font name ('regular', 'small', 'extra_small') to average
+            character width in pixels
+        """
+        avg_char_widths = {}
+        for font_name, use_small in (('regular', False), ('small', True), ('extra_small', True)):
+            try:
+                font = getattr(self.display_manager, f"{font_name}_font")
+                avg_char_widths[font_name] = (
+                    self.display_manager.get_text_width(FONT_PROBE_TEXT, font) / len(FONT_PROBE_TEXT)
+                )
+            except Exception:
+                avg_char_widths[font_name] = 6 if use_small else 8  # Fallback
+        return avg_char_widths
+    
+    def _get_next_olympics(self) -> Tuple[Optional[OlympicsEvent], bool]:
         """
         Determine the next Olympics and whether we're counting down to opening or closing.
         
         Returns:
             Tuple of (olympics_info, is_active)
-            - olympics_info: Dict with 'opening', 'closing', 'type', 'location', or None
+            - olympics_info: OlympicsEvent for the relevant Olympics, or None
             - is_active: True if Olympics is currently happening, False if counting down
         """
-        today = date.today()
-        
-        # Find the next Olympics
-        # Group by Olympics (opening/closing pairs)
-        olympics_events = []
-        for i in range(0, len(OLYMPICS_DATES), 2):
-            if i + 1 < len(OLYMPICS_DATES):
-                opening = OLYMPICS_DATES[i]
-                closing = OLYMPICS_DATES[i + 1]
-                olympics_events.append({
-                    'opening': date(opening[0], opening[1], opening[2]),
-                    'closing': date(closing[0], closing[1], closing[2]),
-                    'type': opening[3],
-                    'location': opening[4]
-                })
-        
-        # Find the next relevant Olympics
-        for event in olympics_events:
-            # If we're before the opening, countdown to opening
-            if today < event['opening']:
-                return event, False
-            # If we're between opening and closing, countdown to closing
-            elif event['opening'] <= today <= event['closing']:
-                return event, True
+        if not _OLYMPICS_EVENTS:
+            return None, False
+        
+        today_ordinal = date.today().toordinal()
+        
+        # First Olympics whose closing ceremony is today or later
+        idx = bisect.bisect_left(_CLOSING_ORDINALS, today_ordinal)
         
         # If we've passed all known Olympics, return the last one (shouldn't happen often)
-        if olympics_events:
-            return olympics_events[-1], False
+        if idx == len(_OLYMPICS_EVENTS):
+            return _OLYMPICS_EVENTS[-1], False
         
-        return None, False
+        # Active if the opening ceremony has already happened, otherwise countdown to opening
+        event = _OLYMPICS_EVENTS[idx]
+        return event, event.opening_ord <= today_ordinal
     
-    def _calculate_days_until(self) -> Tuple[int, bool, Optional[Dict[str, Any]], str]:
+    def _calculate_days_until(self) -> Tuple[int, bool, Optional[OlympicsEvent], str]:
         """
         Calculate days until next Olympics event.
 
@@ -163,24 +237,31 @@ class OlympicsCountdownPlugin(BasePlugin):
             Tuple of (days_until, is_active, olympics_info, countdown_type)
             - days_until: Days until target event (positive = future, 0 = today, negative = past)
             - is_active: True if Olympics is currently happening
-            - olympics_info: Dict with Olympics details or None
+            - olympics_info: OlympicsEvent with Olympics details or None
             - countdown_type: "opening" or "closing"
         """
-        olympics_info, is_active = self._get_next_olympics()
+        today_ord = date.today().toordinal()
         
-        if not olympics_info:
-            return 0, False, None, "opening"
+        # Result only changes once per day
+        if today_ord == self._calc_cache_key:
+            return self._calc_cache_val
         
-        today = date.today()
+        olympics_info, is_active = self._get_next_olympics()
         
-        if is_active:
+        if not olympics_info:
+            result = (0, False, None, "opening")
+        elif is_active:
             # Countdown to closing ceremony
-            days_diff = (olympics_info['closing'] - today).days
-            return days_diff, True, olympics_info, "closing"
+            days_diff = olympics_info.closing_ord - today_ord
+            result = (days_diff, True, olympics_info, "closing")
         else:
             # Countdown to opening ceremony
-            days_diff = (olympics_info['opening'] - today).days
-            return days_diff, False, olympics_info, "opening"
+            days_diff = olympics_info.opening_ord - today_ord
+            result = (days_diff, False, olympics_info, "opening")
+        
+        self._calc_cache_key = today_ord
+        self._calc_cache_val = result
+        return result
     
     def _calculate_text_layout(self, width: int, height: int, lines: list) -> Dict[str, Any]:
         """
@@ -199,6 +280,11 @@ class OlympicsCountdownPlugin(BasePlugin):
             - start_y: Starting Y position for first line
             - use_small_font: Boolean indicating if small font should be used
         """
+        key = (width, height, tuple(lines))
+        hit = self._layout_cache.get(key)
+        if hit:
+            return hit
+        
         # Calculate available space for text (right half of display)
         left_half_width = width // 2
         right_half_width = width - left_half_width
@@ -217,6 +303,9 @@ class OlympicsCountdownPlugin(BasePlugin):
             ('extra_small', self.display_manager.extra_small_font, True)
         ]
 
+        # Longest line length is font-independent
+        max_line_len = max(len(line) for line in lines)
+
         best_font = None
         best_line_height = 8
         best_total_height = 0
@@ -224,12 +313,8 @@ class OlympicsCountdownPlugin(BasePlugin):
 
         # Find the best font that fits all lines within available space
         for font_name, font, use_small in font_options:
-            # Get average character width for this font
-            test_text = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-            try:
-                avg_char_width = self.display_manager.get_text_width(test_text, font) / len(test_text)
-            except:
-                avg_char_width = 6 if use_small else 8  # Fallback
+            # Average character width measured at init
+            avg_char_width = self._avg_char_widths[font_name]
 
             # Calculate line height (font size + small spacing)
             if hasattr(font, 'size'):
@@ -239,7 +324,7 @@ class OlympicsCountdownPlugin(BasePlugin):
                 line_height = 8 if use_small else 10
 
             # Check if all lines fit within available width
-            max_line_width = max(len(line) * avg_char_width for line in lines)
+            max_line_width = max_line_len * avg_char_width
             if max_line_width > available_text_width:
                 continue  # This font is too big for the width
 
@@ -270,13 +355,19 @@ class OlympicsCountdownPlugin(BasePlugin):
         # Calculate starting Y position to center vertically
         start_y = (height - best_total_height) // 2
 
-        return {
+        layout = {
             'font': best_font,
             'line_height': best_line_height,
             'total_text_height': best_total_height,
             'start_y': start_y,
             'use_small_font': best_use_small
         }
+        
+        # Evict the oldest entry once the cache is full
+        if len(self._layout_cache) >= LAYOUT_CACHE_SIZE:
+            self._layout_cache.pop(next(iter(self._layout_cache)))
+        self._layout_cache[key] = layout
+        return layout
     
     def _draw_olympics_rings_programmatic(self, width: int, height: int) -> Image.Image:
         """
@@ -293,37 +384,19 @@ class OlympicsCountdownPlugin(BasePlugin):
         img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
         
-        # Olympic ring colors (from top to bottom)
-        ring_colors = [
-            (0, 129, 200),    # Blue
-            (0, 0, 0),        # Black
-            (255, 20, 24),    # Red
-            (255, 195, 0),    # Yellow
-            (0, 158, 96)      # Green
-        ]
-        
-        # Calculate ring size and positions
+        # Calculate ring size and center
         ring_radius = min(width, height) // 6
+        ring_width = max(1, ring_radius // 8)
         center_x = width // 2
         center_y = height // 2
         
         # Draw rings in Olympic pattern (top row: 3, bottom row: 2)
-        # Top row
-        top_y = center_y - ring_radius
-        for i, color in enumerate(ring_colors[:3]):
-            x = center_x - ring_radius + (i * ring_radius * 1.5)
-            y = top_y
+        for color, dx, dy in RING_LAYOUT:
+            x = center_x + dx * ring_radius
+            y = center_y + dy * ring_radius
             # Draw ring (circle outline)
             bbox = [x - ring_radius, y - ring_radius, x + ring_radius, y + ring_radius]
-            draw.ellipse(bbox, outline=color, width=max(1, ring_radius // 8))
-        
-        # Bottom row
-        bottom_y = center_y + ring_radius
-        for i, color in enumerate(ring_colors[3:]):
-            x = center_x + (i * ring_radius * 1.5)
-            y = bottom_y
-            bbox = [x - ring_radius, y - ring_radius, x + ring_radius, y + ring_radius]
-            draw.ellipse(bbox, outline=color, width=max(1, ring_radius // 8))
+            draw.ellipse(bbox, outline=color, width=ring_width)
         
         return img
     
@@ -339,6 +412,11 @@ class OlympicsCountdownPlugin(BasePlugin):
         Returns:
             PIL Image scaled to fit within dimensions while preserving aspect ratio
         """
+        key = (width, height)
+        cached = self._logo_cache.get(key)
+        if cached is not None:
+            return cached
+        
         if self.logo_image:
             # Calculate scaling to fit within dimensions while preserving aspect ratio
             img_width, img_height = self.logo_image.size
@@ -357,16 +435,60 @@ class OlympicsCountdownPlugin(BasePlugin):
             except AttributeError:
                 # Fall back to old PIL API
                 resized = self.logo_image.resize((new_width, new_height), Image.LANCZOS)
-            
-            # If the image has transparency, ensure it's RGBA
-            if resized.mode != 'RGBA' and self.logo_image.mode == 'RGBA':
-                # Convert to RGBA if original was RGBA
-                resized = resized.convert('RGBA')
-            
-            return resized
         else:
             # Draw programmatically with new dimensions
-            return self._draw_olympics_rings_programmatic(width, height)
+            resized = self._draw_olympics_rings_programmatic(width, height)
+        
+        self._logo_cache[key] = resized
+        return resized
+    
+    def _build_message_lines(self) -> None:
+        """
+        Build the display message and text lines from the current countdown state.
+        
+        Called from update() so display() doesn't rebuild them every frame.
+        """
+        if not self.current_olympics:
+            message = "NO OLYMPICS FOUND"
+            lines = ["NO OLYMPICS", "FOUND"]
+        elif self.is_olympics_active:
+            # Olympics is happening - countdown to closing
+            if self.days_until == 0:
+                message = "OLYMPICS CLOSING"
+                lines = ["OLYMPICS", "CLOSING", "TODAY"]
+            else:
+                olympics_type = self.current_olympics.type.upper()
+                message = f"{self.days_until} DAYS UNTIL CLOSING"
+                lines = [
+                    f"{self.days_until}",
+                    "DAYS UNTIL",
+                    "CLOSING"
+                ]
+        else:
+            # Countdown to opening
+            olympics_type = self.current_olympics.type.upper()
+            location = self.current_olympics.location
+            
+            if self.days_until == 0:
+                message = "OLYMPICS OPENING TODAY"
+                lines = ["OLYMPICS", "OPENING", "TODAY"]
+            else:
+                # Shorten location name if too long
+                if len(location) > 12:
+                    location = location.split('-')[0]  # Use first part if hyphenated
+                if len(location) > 12:
+                    location = location[:10] + ".."
+                
+                message = f"{self.days_until} DAYS UNTIL {olympics_type} OLYMPICS"
+                lines = [
+                    f"{self.days_until}",
+                    "DAYS UNTIL",
+                    f"{olympics_type}",
+                    "OLYMPICS"
+                ]
+        
+        self._cached_message = message
+        self._cached_lines = lines
     
     def update(self) -> None:
         """
@@ -375,23 +497,28 @@ class OlympicsCountdownPlugin(BasePlugin):
         Called periodically to recalculate days until Olympics.
         """
         try:
+            # Countdown only changes at midnight, skip work for the rest of the day
+            today = date.today()
+            if today == self.last_calculated_date and self.current_olympics is not None:
+                return
+            
             days, is_active, olympics_info, countdown_type = self._calculate_days_until()
             self.days_until = days
             self.is_olympics_active = is_active
             self.current_olympics = olympics_info
             self.countdown_type = countdown_type
+            self._build_message_lines()
             
             # Only log when the day changes
-            today = date.today()
             if self.last_calculated_date != today:
                 if olympics_info:
                     if is_active:
-                        self.logger.info(f"Olympics {olympics_info['type']} {olympics_info['location']} is active. Days until closing: {days}")
+                        self.logger.info(f"Olympics {olympics_info.type} {olympics_info.location} is active. Days until closing: {days}")
                     else:
-                        self.logger.info(f"Days until {olympics_info['type']} Olympics {olympics_info['location']} opening: {days}")
+                        self.logger.info(f"Days until {olympics_info.type} Olympics {olympics_info.location} opening: {days}")
                 else:
                     self.logger.warning("No upcoming Olympics found")
-                self.last_calculated_date = today
+            self.last_calculated_date = today
                 
         except Exception as e:
             self.logger.error(f"Error updating countdown: {e}")
@@ -406,58 +533,21 @@ class OlympicsCountdownPlugin(BasePlugin):
         """
         try:
             # Ensure update() has been called
-            if not hasattr(self, 'days_until'):
+            if self._cached_lines is None:
                 self.update()
             
-            # Get display dimensions
-            width = self.display_manager.width
-            height = self.display_manager.height
-            
-            # Determine text to display
-            if not self.current_olympics:
-                message = "NO OLYMPICS FOUND"
-                lines = ["NO OLYMPICS", "FOUND"]
-            elif self.is_olympics_active:
-                # Olympics is happening - countdown to closing
-                if self.days_until == 0:
-                    message = "OLYMPICS CLOSING"
-                    lines = ["OLYMPICS", "CLOSING", "TODAY"]
-                else:
-                    olympics_type = self.current_olympics['type'].upper()
-                    message = f"{self.days_until} DAYS UNTIL CLOSING"
-                    lines = [
-                        f"{self.days_until}",
-                        "DAYS UNTIL",
-                        "CLOSING"
-                    ]
-            else:
-                # Countdown to opening
-                olympics_type = self.current_olympics['type'].upper()
-                location = self.current_olympics['location']
-                
-                if self.days_until == 0:
-                    message = "OLYMPICS OPENING TODAY"
-                    lines = ["OLYMPICS", "OPENING", "TODAY"]
-                else:
-                    # Shorten location name if too long
-                    if len(location) > 12:
-                        location = location.split('-')[0]  # Use first part if hyphenated
-                    if len(location) > 12:
-                        location = location[:10] + ".."
-                    
-                    message = f"{self.days_until} DAYS UNTIL {olympics_type} OLYMPICS"
-                    lines = [
-                        f"{self.days_until}",
-                        "DAYS UNTIL",
-                        f"{olympics_type}",
-                        "OLYMPICS"
-                    ]
-            
             # Check if we need to redraw (prevent blinking)
             # Only redraw if the message changed or force_clear is True
-            if not force_clear and self.last_displayed_message == message:
+            if not force_clear and self._cached_message == self.last_displayed_message:
                 return  # No change, skip redraw
             
+            message = self._cached_message
+            lines = self._cached_lines
+            
+            # Get display dimensions
+            width = self.display_manager.width
+            height = self.display_manager.height
+            
             # Clear display
             self.display_manager.clear()
             
@@ -478,11 +568,8 @@ class OlympicsCountdownPlugin(BasePlugin):
             
             # Draw logo on left side
             if logo_img:
-                # Paste logo onto display (handle RGBA with alpha channel)
-                if logo_img.mode == 'RGBA':
-                    self.display_manager.image.paste(logo_img, (logo_x, logo_y), logo_img)
-                else:
-                    self.display_manager.image.paste(logo_img, (logo_x, logo_y))
+                # Paste logo onto display (logo is always RGBA, use alpha channel as mask)
+                self.display_manager.image.paste(logo_img, (logo_x, logo_y), logo_img)
             
             # Calculate optimal text layout based on display size
             layout = self._calculate_text_layout(width, height, lines)
@@ -547,13 +634,8 @@ class OlympicsCountdownPlugin(BasePlugin):
         if not isinstance(self.text_color, tuple) or len(self.text_color) != 3:
             self.logger.error("Invalid text_color: must be RGB tuple")
             return False
-        try:
-            # Convert to integers and validate range
-            color_ints = [int(c) for c in self.text_color]
-            if not all(0 <= c <= 255 for c in color_ints):
-                self.logger.error("Invalid text_color: values must be 0-255")
-                return False
-        except (ValueError, TypeError):
+        # Values are converted to clamped ints when parsed; anything else failed to parse
+        if not all(isinstance(c, int) for c in self.text_color):
             self.logger.error("Invalid text_color: values must be numeric")
             return False
         
@@ -568,10 +650,11 @@ class OlympicsCountdownPlugin(BasePlugin):
     def get_info(self) -> Dict[str, Any]:
         """Return plugin info for web UI."""
         info = super().get_info()
+        current_olympics = getattr(self, 'current_olympics', None)
         info.update({
             'days_until': getattr(self, 'days_until', None),
             'is_olympics_active': getattr(self, 'is_olympics_active', False),
-            'current_olympics': getattr(self, 'current_olympics', None),
+            'current_olympics': current_olympics._asdict() if current_olympics else None,
             'countdown_type': getattr(self, 'countdown_type', 'opening'),
             'text_color': self.text_color,
             'logo_size': self.logo_size